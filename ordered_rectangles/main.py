@@ -1,5 +1,5 @@
 
-from typing import Union, Iterable, Tuple, List, Sequence, Dict, TypeVar
+from typing import Union, Iterable, Tuple, List, Sequence, Dict, TypeVar, Optional
 from typing_extensions import TypeAlias
 
 import os
@@ -7,6 +7,7 @@ from pathlib import Path
 import json
 
 import numpy as np
+import numba
 
 #region ALIASES
 
@@ -37,8 +38,16 @@ where (1, 2, 3, 4) means to fill [1:3, 2:4] including bounds, one-based
 _EMPTY_FILLER_INT: int = -2
 _BOUND_FILLER_INT: int = -1
 
+_PACKED_COORD_MAX: int = 0xFFFF
+"""max rectangle coordinate available for packing"""
+_PACKED_SHIFTS = np.array((48, 32, 16, 0), dtype=np.uint64)
+"""bits shifts of packed (x1, y1, x2, y2) coordinates"""
+
+_UNKNOWN_SYMBOL_INT: int = -128
+"""value for the symbols which cannot be in the map string view"""
+
 FILLERS_INT = (_BOUND_FILLER_INT, _EMPTY_FILLER_INT)
-"""values in the numpy map reserved for non-labeled data"""
+"""values in the numpy map reserved for non-labeled data, they are negative so `v >= 0` means a label digit"""
 
 
 class Config:
@@ -103,6 +112,17 @@ def are_equal_arrs(a: array2D, b: array2D) -> bool:
     return a.shape == b.shape and (a == b).all()
 
 
+def concat_aranges(starts: array1D, lengths: array1D) -> array1D:
+    """
+    vectorized version of `np.concatenate([np.arange(s, s + n) for s, n in zip(starts, lengths)])`
+
+    >>> concat_aranges(np.array([1, 10, 5]), np.array([3, 0, 2]))
+    array([1, 2, 3, 5, 6])
+    """
+    ends = np.cumsum(lengths)
+    return np.arange(ends[-1] if ends.size else 0) + np.repeat(starts - ends + lengths, lengths)
+
+
 def change_order(box: Box) -> Box:
     """
     >>> change_order((1, 2, 3, 4))
@@ -155,6 +175,44 @@ def has_invalid_bounds(rectangles: array2D) -> bool:
     return bool(get_mask_of_invalid_bounds(rectangles).any())
 
 
+def get_labels_lengths(count: int) -> array1D:
+    """
+    digits counts of labels 1, 2, ..., count
+
+    >>> get_labels_lengths(11)
+    array([1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2])
+    """
+    labels = np.arange(1, count + 1)
+    lengths = np.ones(count, dtype=int)
+    p = 10
+    while p <= count:
+        lengths += labels >= p
+        p *= 10
+    return lengths
+
+
+def get_labels_digits(count: int) -> Tuple[array1D, array1D]:
+    """
+    digits of labels 1, 2, ..., count
+    Args:
+        count:
+
+    Returns:
+        pair (all labels digits concatenated, labels lengths)
+
+    >>> digits, lengths = get_labels_digits(12)
+    >>> digits
+    array([1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 0, 1, 1, 1, 2], dtype=int8)
+    >>> lengths
+    array([1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2])
+    """
+    lengths = get_labels_lengths(count)
+    powers = np.repeat(lengths - 1, lengths) - concat_aranges(np.zeros(count, dtype=int), lengths)
+    """position of each digit from the end of its label"""
+    digits = np.repeat(np.arange(1, count + 1), lengths) // 10 ** powers % 10
+    return digits.astype(np.int8), lengths
+
+
 def get_mask_of_too_short_widths(rectangles: arrayRectsInt) -> array1DMask:
     """
     seeks for rectangles with to short width to contain its index label with a margin:
@@ -168,13 +226,72 @@ def get_mask_of_too_short_widths(rectangles: arrayRectsInt) -> array1DMask:
     >>> mask = _(np.array([(1, i, 1, i + 1) for i in range(11)])); mask * 1
     array([0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1])
     """
-    return rectangles[:, 3] - rectangles[:, 1] < np.array([len(str(i)) for i in range(1, rectangles.shape[0] + 1)])
+    return rectangles[:, 3] - rectangles[:, 1] < get_labels_lengths(rectangles.shape[0])
 
 
 def has_too_short_widths(rectangles: arrayRectsInt) -> bool:
     return bool(get_mask_of_too_short_widths(rectangles).any())
 
 
+def get_fillers_codes() -> Tuple[int, int]:
+    """
+    code points of (empty, bound) fillers from the `Config`
+
+    >>> get_fillers_codes()
+    (32, 35)
+    """
+    for name in ('EMPTY_FILLER_STR', 'BOUND_FILLER_STR'):
+        v = getattr(Config, name)
+        if not isinstance(v, str) or len(v) != 1:
+            raise ValueError(f"Config.{name} must be a single symbol, got {v!r}")
+    return ord(Config.EMPTY_FILLER_STR), ord(Config.BOUND_FILLER_STR)
+
+
+def get_symbols_lut() -> array1D:
+    """
+    lookup table converting the map values viewed as uint8 to the code points of the map string view
+
+    >>> lut = get_symbols_lut()
+    >>> ''.join(map(chr, lut[np.array([1, 0, _BOUND_FILLER_INT, _EMPTY_FILLER_INT, 9], dtype=np.int8).view(np.uint8)]))
+    '10# 9'
+    """
+    empty_code, bound_code = get_fillers_codes()
+    lut = np.full(256, ord('?'), dtype=np.uint32)
+    lut[:10] = np.arange(ord('0'), ord('9') + 1)
+    # negative fillers are the tail of the table like in their uint8 view
+    lut[_EMPTY_FILLER_INT] = empty_code
+    lut[_BOUND_FILLER_INT] = bound_code
+    return lut
+
+
+def pack_rects(rectangles: arrayRectsInt) -> array1D:
+    """
+    packs each (x1, y1, x2, y2) rectangle with 16-bit coordinates to one uint64 value
+
+    >>> p = pack_rects(np.array([(1, 2, 3, 4), (5, 6, 65535, 8)])); [hex(v) for v in p.tolist()]
+    ['0x1000200030004', '0x50006ffff0008']
+    >>> unpack_rects(p)
+    array([[    1,     2,     3,     4],
+           [    5,     6, 65535,     8]], dtype=int32)
+    >>> pack_rects(np.array([(1, 1, 2, 70000), (-3, 1, 2, 3)]))
+    Traceback (most recent call last):
+    ...
+    ValueError: next rectangles coordinates do not fit 16 bits: [[    1     1     2 70000]
+     [   -3     1     2     3]]
+    """
+    bad_rects_mask = ((rectangles < 0) | (rectangles > _PACKED_COORD_MAX)).any(axis=1)
+    if bad_rects_mask.any():
+        raise ValueError(f"next rectangles coordinates do not fit 16 bits: {rectangles[bad_rects_mask]}")
+
+    r = rectangles.astype(np.uint64)
+    return np.bitwise_or.reduce(r << _PACKED_SHIFTS, axis=1)
+
+
+def unpack_rects(packed: array1D) -> arrayRectsInt:
+    """inverse of `pack_rects`"""
+    return ((packed[:, np.newaxis] >> _PACKED_SHIFTS) & _PACKED_COORD_MAX).astype(np.int32)
+
+
 def has_invalid_rectangles(rectangles: array2D) -> bool:
     """function using for units autosearch checks"""
     return (
@@ -186,6 +303,321 @@ def has_invalid_rectangles(rectangles: array2D) -> bool:
 #endregion
 
 
+#region KERNELS
+
+_PARSE_OK: int = 0
+_PARSE_NOT_MATCHED_RIGHT: int = 1
+_PARSE_NOT_MATCHED_BOTTOM: int = 2
+_PARSE_BROKEN_HOLE: int = 3
+_PARSE_REPEATED_LABEL: int = 4
+
+
+@numba.njit(cache=True)
+def _parse_kernel(arr: array2D):
+    """
+    seeks for labeled rectangles on the map array without its changing:
+        labels are found in the row-major order and the search continues after the last found label,
+        while the bounds seeking looks only at the cells after the label, so found labels are never met again
+
+    Returns:
+        tuple (rects, error code, x, y) where
+            rects is (N, 4) array of one-based rectangles where N is the count of found labels,
+                the rectangle labeled n is the row n - 1 and the rows of not found labels are filled with -1
+            error code is one of _PARSE_* values and (x, y) is the start of the rectangle caused the error
+    """
+    H, W = arr.shape
+
+    count = 0
+    for x in range(H):
+        for y in range(W):
+            v = arr[x, y]
+            if v >= 0:  # digit
+                count += 1
+    rects = np.full((count, 4), -1, dtype=np.int32)
+    """preallocated for the worst case of one-digit labels only"""
+
+    k = 0
+    x0 = 0
+    y0 = 0
+    """position to continue the search from cuz labels are found in the row-major order"""
+    while True:
+        found = False
+        x = x0
+        y = y0
+        while x < H:
+            while y < W:
+                if arr[x, y] >= 0:  # digit
+                    found = True
+                    break
+                y += 1
+            if found:  # stop the search cuz next x,y pair is found
+                break
+            x += 1
+            y = 0
+        if not found:  # no digits found -- stop while loop
+            break
+
+        n = int(arr[x, y])
+        n_len = 1
+        has_hole = x + 1 < H and y + 1 < W and arr[x + 1, y + 1] == _EMPTY_FILLER_INT
+        """the label is on the map edge means no hole, such rectangle will be rejected as invalid"""
+        check_next_digits = True
+
+        matched = False
+        _y = y + 1
+        while _y < W:  # seek for right bound
+            v = arr[x, _y]
+            if (
+                v == _EMPTY_FILLER_INT or  # first empty
+                (v != _BOUND_FILLER_INT and not check_next_digits)  # first digit which is not for current number
+            ):  # if not hole, the target if to find first empty
+                if has_hole:
+                    return rects[:k], _PARSE_BROKEN_HOLE, x, y
+                _y -= 1
+                matched = True
+                break
+
+            if check_next_digits:
+                if v != _BOUND_FILLER_INT:  # next digit
+                    n = 10 * n + v
+                    n_len += 1
+                else:
+                    check_next_digits = False  # stop checking on first mismatch
+
+            if has_hole:  # if there is a hole, the target is to find the hole finish
+                if arr[x + 1, _y] == _BOUND_FILLER_INT:  # it is right bound
+                    matched = True
+                    break
+            _y += 1
+        if not matched:
+            if has_hole:
+                return rects[:k], _PARSE_NOT_MATCHED_RIGHT, x, y
+            _y = W - 1
+
+        matched = False
+        _x = x + 1
+        while _x < H:  # seek for bottom bound
+            if arr[_x, y] != _BOUND_FILLER_INT:
+                if has_hole:
+                    return rects[:k], _PARSE_BROKEN_HOLE, x, y
+                _x -= 1
+                matched = True
+                break
+            if has_hole:
+                if arr[_x, y + 1] == _BOUND_FILLER_INT:  # it is bottom bound
+                    matched = True
+                    break
+            _x += 1
+        if not matched:
+            if has_hole:
+                return rects[:k], _PARSE_NOT_MATCHED_BOTTOM, x, y
+            _x = H - 1
+
+        if 0 < n <= count:  # other labels are out of range and will cause missing labels
+            if rects[n - 1, 0] != -1:
+                return rects[:k], _PARSE_REPEATED_LABEL, x, y
+            rects[n - 1, 0] = x + 1
+            rects[n - 1, 1] = y + 1
+            rects[n - 1, 2] = _x + 1
+            rects[n - 1, 3] = _y + 1
+        k += 1
+        x0 = x
+        y0 = y + n_len
+
+    # labels must be 1..k, so the rows after k are empty or some of first k rows are
+    return rects[:k], _PARSE_OK, 0, 0
+
+
+@numba.njit(cache=True)
+def _unpack_rect(r: np.uint64) -> Tuple[int, int, int, int]:
+    """(x1, y1, x2, y2) of the rectangle packed by `pack_rects`"""
+    mask = np.uint64(_PACKED_COORD_MAX)
+    return (
+        np.int64((r >> _PACKED_SHIFTS[0]) & mask),
+        np.int64((r >> _PACKED_SHIFTS[1]) & mask),
+        np.int64((r >> _PACKED_SHIFTS[2]) & mask),
+        np.int64((r >> _PACKED_SHIFTS[3]) & mask),
+    )
+
+
+@numba.njit(cache=True)
+def _bounds_kernel(packed: array1D) -> Tuple[int, int, int, int]:
+    """
+    (xmin, ymin, xmax, ymax) of the packed rectangles by one pass
+    """
+    xmin = ymin = _PACKED_COORD_MAX
+    xmax = ymax = 0
+    for i in range(packed.shape[0]):
+        x1, y1, x2, y2 = _unpack_rect(packed[i])
+        xmin = min(xmin, x1)
+        ymin = min(ymin, y1)
+        xmax = max(xmax, x2)
+        ymax = max(ymax, y2)
+    return xmin, ymin, xmax, ymax
+
+
+@numba.njit(cache=True, parallel=True)
+def _rasterize_kernel(packed: array1D, digits: array1D, lengths: array1D) -> array2D:
+    """
+    draws the map array of the packed rectangles, labels are drawn over the bounds if `digits` are not empty
+
+    the bounds are drawn in parallel cuz they are the same value for all rectangles,
+        the labels are drawn after them sequentially to keep the order of overlapping labels
+    """
+    N = packed.shape[0]
+
+    _, _, xmax, ymax = _bounds_kernel(packed)
+    arr = np.full((xmax, ymax), _EMPTY_FILLER_INT, dtype=np.int8)
+
+    for i in numba.prange(N):
+        x1, y1, x2, y2 = _unpack_rect(packed[i])
+        x1 -= 1
+        y1 -= 1
+        x2 -= 1
+        y2 -= 1
+        arr[x1, y1: y2 + 1] = _BOUND_FILLER_INT
+        arr[x2, y1: y2 + 1] = _BOUND_FILLER_INT
+        arr[x1: x2 + 1, y1] = _BOUND_FILLER_INT
+        arr[x1: x2 + 1, y2] = _BOUND_FILLER_INT
+
+    if digits.size:
+        p = 0
+        for i in range(N):
+            x1, y1, _, _ = _unpack_rect(packed[i])
+            for k in range(lengths[i]):
+                arr[x1 - 1, y1 - 1 + k] = digits[p + k]
+            p += lengths[i]
+
+    return arr
+
+
+@numba.njit(cache=True)
+def _to_codes_kernel(arr: array2D, lut: array1D) -> array2D:
+    """
+    converts the map array to the code points of its string view lines with trailing new line symbols
+    """
+    H, W = arr.shape
+    chars = np.empty((H, W + 1), dtype=np.uint32)
+    for x in range(H):
+        for y in range(W):
+            chars[x, y] = lut[np.uint8(arr[x, y])]
+        chars[x, W] = 10  # new line
+    return chars
+
+
+@numba.njit(cache=True)
+def _from_codes_kernel(codes: array1D, empty_code: int, bound_code: int):
+    """
+    converts the code points of the map string view lines joined by new line symbols to the map array,
+        short lines are padded by the empty filler, unknown symbols are converted to _UNKNOWN_SYMBOL_INT
+
+    Returns:
+        pair (map array, whether there are unknown symbols)
+    """
+    H = 1
+    W = 0
+    w = 0
+    for c in codes:
+        if c == 10:  # new line
+            H += 1
+            w = 0
+        else:
+            w += 1
+            W = max(W, w)
+
+    arr = np.full((H, W), _EMPTY_FILLER_INT, dtype=np.int8)
+    has_unknown = False
+    x = 0
+    y = 0
+    for c in codes:
+        if c == 10:
+            x += 1
+            y = 0
+        else:
+            if 48 <= c <= 57:  # digit
+                arr[x, y] = c - 48
+            elif c == empty_code:
+                arr[x, y] = _EMPTY_FILLER_INT
+            elif c == bound_code:
+                arr[x, y] = _BOUND_FILLER_INT
+            else:
+                arr[x, y] = _UNKNOWN_SYMBOL_INT
+                has_unknown = True
+            y += 1
+
+    return arr, has_unknown
+
+
+@numba.njit(cache=True)
+def _verify_kernel(rects: arrayRectsInt, order: array1D, digits: array1D, lengths: array1D, arr: array2D):
+    """
+    compares the map array with `RectTextViewer(rects).to_array(show_order=True)` without making it:
+        each map row is compared with the same row drawn in a small buffer,
+        the rectangles are taken from the active set updated in `order` of their top bounds
+
+    Returns:
+        (x, y) of the first mismatch or (-1, -1) if there are no mismatches,
+            the cells out of the rectangles area must be empty
+    """
+    H, W = arr.shape
+    N = rects.shape[0]
+
+    starts = np.empty(N, dtype=np.int64)
+    """start of each label in digits"""
+    p = 0
+    for i in range(N):
+        starts[i] = p
+        p += lengths[i]
+
+    row = np.empty(W, dtype=np.int8)
+    active = np.empty(N, dtype=np.int64)
+    m = 0
+    """count of rectangles crossing current row"""
+    t = 0
+    """count of rectangles taken from the order"""
+
+    for x in range(H):
+        row[:] = _EMPTY_FILLER_INT
+
+        new_start = m
+        while t < N and rects[order[t], 0] - 1 == x:
+            active[m] = order[t]
+            m += 1
+            t += 1
+
+        for j in range(m):
+            i = active[j]
+            y1 = rects[i, 1] - 1
+            y2 = rects[i, 3] - 1
+            if x == rects[i, 0] - 1 or x == rects[i, 2] - 1:
+                row[y1: y2 + 1] = _BOUND_FILLER_INT
+            else:
+                row[y1] = _BOUND_FILLER_INT
+                row[y2] = _BOUND_FILLER_INT
+
+        for j in range(new_start, m):  # labels over bounds for the rectangles started on this row
+            i = active[j]
+            y1 = rects[i, 1] - 1
+            for k in range(lengths[i]):
+                row[y1 + k] = digits[starts[i] + k]
+
+        _m = 0
+        for j in range(m):  # remove finished rectangles
+            i = active[j]
+            if x < rects[i, 2] - 1:
+                active[_m] = i
+                _m += 1
+        m = _m
+
+        for y in range(W):
+            if row[y] != arr[x, y]:
+                return x, y
+
+    return -1, -1
+
+#endregion
+
+
 class RectTextViewer:
     """
     implements (array of coordinates rectangles) -> (str) conversion logic
@@ -204,15 +636,63 @@ class RectTextViewer:
          # #
          ###
     >>> vr2 = RectTextViewer.from_string(vrs); assert vr == vr2
+
+    >>> RectTextViewer(np.array([(1, 1, 2, 2 ** 32 + 3)]))
+    Traceback (most recent call last):
+    ...
+    ValueError: next rectangles coordinates are out of [1; 65535] range: [[         1          1          2 4294967299]]
+    >>> RectTextViewer([(1.7, 1.2, 2.9, 3.5)])
+    Traceback (most recent call last):
+    ...
+    TypeError: rectangles coordinates must be integers, got float64
     """
 
     def __init__(self, rectangles: Union[arrayRectsInt, Iterable[BoxInt]]):
+        self.rects = rectangles
+
+    @property
+    def rects(self) -> arrayRectsInt:
+        """
+        read-only rectangles unpacked from `rects_packed` on first access, use the setter to change them
+
+        >>> vr = RectTextViewer([(1, 1, 2, 3)])
+        >>> vr.rects[0, 0] = 2
+        Traceback (most recent call last):
+        ...
+        ValueError: assignment destination is read-only
+        >>> vr.rects is vr.rects  # unpacked once
+        True
+        >>> vr.rects = np.array([(2, 1, 3, 3)]); vr.rects
+        array([[2, 1, 3, 3]], dtype=int32)
+        >>> vr.rects = np.array([(50, 1, 2, 3)])  # the setter checks the rectangles like the constructor
+        Traceback (most recent call last):
+        ...
+        ValueError: next rectangles are not valid by bounds: [[50  1  2  3]]
+        """
+        if self._rects_cache is None:
+            self._rects_cache = unpack_rects(self._rects_packed)
+            self._rects_cache.setflags(write=False)
+        return self._rects_cache
+
+    @rects.setter
+    def rects(self, rectangles: Union[arrayRectsInt, Iterable[BoxInt]]):
 
         if not isinstance(rectangles, np.ndarray):
             rectangles = np.array([r for r in rectangles])
 
-        assert rectangles.shape[1] == 4, rectangles.shape
-        assert (rectangles > 0).all()
+        if not np.issubdtype(rectangles.dtype, np.integer):
+            raise TypeError(f"rectangles coordinates must be integers, got {rectangles.dtype}")
+        if rectangles.ndim != 2 or rectangles.shape[1] != 4:
+            raise ValueError(f"rectangles array must have (N, 4) shape, got {rectangles.shape}")
+
+        bad_rects_mask = ((rectangles <= 0) | (rectangles > _PACKED_COORD_MAX)).any(axis=1)
+        if bad_rects_mask.any():
+            raise ValueError(
+                f"next rectangles coordinates are out of [1; {_PACKED_COORD_MAX}] range: {rectangles[bad_rects_mask]}"
+            )
+
+        if not (rectangles.flags.c_contiguous and rectangles.dtype == np.int32):  # checked values fit int32
+            rectangles = np.ascontiguousarray(rectangles, dtype=np.int32)
 
         bad_rects_mask = get_mask_of_invalid_bounds(rectangles)
         if bad_rects_mask.any():
@@ -222,21 +702,33 @@ class RectTextViewer:
         if bad_rects_mask.any():
             raise ValueError(f"next rectangles have too short width: {rectangles[bad_rects_mask]}")
 
-        self.rects = rectangles
+        self._rects_packed = pack_rects(rectangles)  # always a new array
+        self._rects_packed.setflags(write=False)
+        self._rects_cache: Optional[arrayRectsInt] = None
+        """read-only unpacked rectangles, they are valid while the rectangles are not changed"""
+        self._array_cache: Dict[bool, array2D] = {}
+        """read-only `to_array` results by `show_order` value, they are valid while the rectangles are not changed"""
+
+    @property
+    def rects_packed(self) -> array1D:
+        """read-only rectangles packed by `pack_rects`"""
+        return self._rects_packed
 
     def __str__(self):
-        return f'viewer of {self.rects.shape[0]} rectangles'
+        return f'viewer of {self.rects_packed.shape[0]} rectangles'
 
     def __eq__(self, other):
-        return are_equal_arrs(self.rects, other.rects)
+        return are_equal_arrs(self.rects_packed, other.rects_packed)
 
     @property
     def h_units(self) -> int:
-        return self.rects[:, 2].max() - self.rects[:, 0].min() + 1
+        xmin, _, xmax, _ = _bounds_kernel(self.rects_packed)
+        return xmax - xmin + 1
 
     @property
     def w_units(self) -> int:
-        return self.rects[:, 3].max() - self.rects[:, 1].min() + 1
+        _, ymin, _, ymax = _bounds_kernel(self.rects_packed)
+        return ymax - ymin + 1
 
     @property
     def units(self):
@@ -246,7 +738,8 @@ class RectTextViewer:
         >>> assert RectTextViewer([(1, 1, 2, 3)]).units == 3
         >>> assert RectTextViewer([(1, 2, 3, 4), (10, 11, 12, 13)]).units == 13
         """
-        return self.rects[:, 2:].max() - self.rects[:, :2].min() + 1
+        xmin, ymin, xmax, ymax = _bounds_kernel(self.rects_packed)
+        return max(xmax, ymax) - min(xmin, ymin) + 1
 
     def to_array(self, show_order: bool = False) -> array2D:
         """
@@ -266,35 +759,38 @@ class RectTextViewer:
                [-1, -1, -2, -1, -2, -2, -1],
                [-1, -1, -2, -1, -1, -1, -1]], dtype=int8)
 
+        Notes:
+            the result is cached for each `show_order` value and so is read-only
         """
-        xmax = self.rects[:, 2].max()
-        ymax = self.rects[:, 3].max()
-
-        arr = np.full((xmax, ymax), fill_value=_EMPTY_FILLER_INT, dtype=np.int8)
+        arr = self._array_cache.get(show_order)
+        if arr is not None:
+            return arr
 
-        for i, (x1, y1, x2, y2) in enumerate(self.rects, 1):
-            x1 -= 1
-            y1 -= 1
-            arr[x1, y1: y2] = _BOUND_FILLER_INT
-            arr[x2 - 1, y1: y2] = _BOUND_FILLER_INT
-            arr[x1: x2, y1] = _BOUND_FILLER_INT
-            arr[x1: x2, y2 - 1] = _BOUND_FILLER_INT
-
-            if show_order:
-                numbers = [int(s) for s in str(i)]
-                arr[x1, y1: y1 + len(numbers)] = numbers
+        if show_order:
+            digits, lengths = get_labels_digits(self.rects_packed.shape[0])
+        else:
+            digits, lengths = np.empty(0, dtype=np.int8), np.empty(0, dtype=int)
+        arr = _rasterize_kernel(self.rects_packed, digits, lengths)
+        arr.setflags(write=False)
 
+        self._array_cache[show_order] = arr
         return arr
 
     @staticmethod
-    def from_array(arr: array2D):
+    def from_array(arr: array2D, validate: bool = True):
         """
+        Args:
+            arr: the map array
+            validate: whether to check that the found rectangles reproduce the map exactly,
+                `False` skips the verification pass for the maps known to be made by `to_array`
+
         >>> vr = RectTextViewer([(1, 1, 3, 3), (1, 5, 3, 7)])  # simple case
         >>> rr = vr.to_array(show_order=True); rr
         array([[ 1, -1, -1, -2,  2, -1, -1],
                [-1, -2, -1, -2, -1, -2, -1],
                [-1, -1, -1, -2, -1, -1, -1]], dtype=int8)
         >>> new = RectTextViewer.from_array(rr); assert vr == new
+        >>> new = RectTextViewer.from_array(rr, validate=False); assert vr == new
 
         >>> vr = RectTextViewer(  # hard case
         ...     np.array(
@@ -354,93 +850,44 @@ class RectTextViewer:
         ####
         >>> rr = vr.to_array(show_order=True); new = RectTextViewer.from_array(rr); assert vr == new
         """
-        uniqs = np.unique(arr)
-
-        if (uniqs == _EMPTY_FILLER_INT).all():
-            raise ValueError(f"no rectangles found")
-
-        unlabeled_mask = np.isin(uniqs, FILLERS_INT)
-
-        if unlabeled_mask.all():
+        if not (arr >= 0).any():  # no digits cuz fillers are negative
+            if (arr == _EMPTY_FILLER_INT).all():
+                raise ValueError(f"no rectangles found")
             raise ValueError(f"all rectangles are unlabeled")
 
-        H, W = arr.shape
-        arr_cp = arr.copy()
-
-        rects = {}
-
-        while True:
-            for x, row in enumerate(arr_cp):
-                digits_inds = np.nonzero(~np.isin(row, FILLERS_INT))[0]
-                """indexes of digits"""
-                if digits_inds.size != 0:
-                    y = digits_inds[0]
-                    break  # stop for loop cuz next x,y pair is found
-            else:  # no digits found -- stop while loop
-                break
-
-            n = arr_cp[x, y]
-            has_hole = arr_cp[x + 1, y + 1] == _EMPTY_FILLER_INT
-            check_next_digits = True
-
-            for _y in range(y + 1, W):  # seek for right bound
-                v = row[_y]
-                if (
-                    v == _EMPTY_FILLER_INT or  # first empty
-                    (v != _BOUND_FILLER_INT and not check_next_digits)  # first digit which is not for current number
-                ):  # if not hole, the target if to find first empty
-                    assert not has_hole
-                    _y -= 1
-                    break
-
-                if check_next_digits:
-                    if v != _BOUND_FILLER_INT:  # next digit
-                        n = 10 * n + v
-                    else:
-                        check_next_digits = False  # stop checking on first mismatch
-
-                if has_hole:  # if there is a hole, the target is to find the hole finish
-                    if arr_cp[x + 1, _y] == _BOUND_FILLER_INT:  # it is right bound
-                        break
-            else:
-                if has_hole:
-                    raise Exception(f"rectangle starts on ({x}, {y}) is not matched (at right)")
-
-            for _x in range(x + 1, H):  # seek for bottom bound
-                if arr_cp[_x, y] != _BOUND_FILLER_INT:
-                    assert not has_hole
-                    _x -= 1
-                    break
-                if has_hole:
-                    v = arr_cp[_x, y + 1]
-                    if v == _BOUND_FILLER_INT:  # it is bottom bound
-                        break
-            else:
-                if has_hole:
-                    raise Exception(f"rectangle starts on ({x}, {y}) is not matched (at bottom)")
-
-            assert n not in rects, f"{n} label repeats on the map"
-            rects[n] = (x, y, _x, _y)
-            # arr_cp[x: _x + 1, y: _y + 1] = _EMPTY_FILLER_INT
-            arr_cp[x, y: y + len(str(n))] = _EMPTY_FILLER_INT  # remove only number label
-
-        numbers = np.array(sorted(rects.keys()))
-        all_numbers = np.arange(numbers[0], numbers[-1] + 1)
-        if numbers.size != all_numbers.size:
+        rects, error, x, y = _parse_kernel(arr)
+        if error == _PARSE_NOT_MATCHED_RIGHT:
+            raise Exception(f"rectangle starts on ({x}, {y}) is not matched (at right)")
+        if error == _PARSE_NOT_MATCHED_BOTTOM:
+            raise Exception(f"rectangle starts on ({x}, {y}) is not matched (at bottom)")
+        if error == _PARSE_BROKEN_HOLE:
+            raise ValueError(f"rectangle starts on ({x}, {y}) has broken bounds")
+        if error == _PARSE_REPEATED_LABEL:
+            raise ValueError(f"label of rectangle starts on ({x}, {y}) repeats on the map")
+
+        missing_mask = rects[:, 0] == -1
+        if missing_mask.any():
             raise ValueError(
-                f"next labels not found {[a for a in all_numbers if a not in numbers]}"
+                f"next labels not found {(np.flatnonzero(missing_mask) + 1).tolist()}"
             )
 
-        result = RectTextViewer(
-            np.array([rects[n] for n in numbers]) + 1
-        )
+        result = RectTextViewer(rects)
+
+        if not validate:
+            return result
 
-        diff_mask = result.to_array(show_order=True) != arr
-        if diff_mask.any():
+        digits, lengths = get_labels_digits(rects.shape[0])
+        x, y = _verify_kernel(rects, np.argsort(rects[:, 0], kind='stable'), digits, lengths, arr)
+        if x != -1:
+            expected = np.full_like(arr, _EMPTY_FILLER_INT)
+            result_arr = result.to_array(show_order=True)
+            expected[:result_arr.shape[0], :result_arr.shape[1]] = result_arr
+            diff_mask = expected != arr
             r = arr.copy()
             r[~diff_mask] = _EMPTY_FILLER_INT
             raise ValueError(
-                f"some mismatches found, possible bad structure or not all rectangles are labeled: {r}"
+                f"some mismatches found (first on ({x}, {y})), "
+                f"possible bad structure or not all rectangles are labeled: {r}"
             )
 
         return result
@@ -456,20 +903,21 @@ class RectTextViewer:
         ## #   #
         ## #   #
            #####
+
+        Non-ASCII fillers are supported too:
+        >>> Config.BOUND_FILLER_STR = '█'
+        >>> print(vr.to_string(show_order=True))  # doctest: +NORMALIZE_WHITESPACE
+        1██
+        ███
+           2████
+        3█ █   █
+        ██ █   █
+        ██ █   █
+           █████
+        >>> Config.BOUND_FILLER_STR = '#'
         """
-        return '\n'.join(
-            ''.join(
-                (
-                    Config.EMPTY_FILLER_STR if n == _EMPTY_FILLER_INT else (
-                        Config.BOUND_FILLER_STR if n == _BOUND_FILLER_INT else (
-                            str(n)
-                        )
-                    )
-                )
-                for n in line
-            )
-            for line in self.to_array(show_order=show_order)
-        )
+        chars = _to_codes_kernel(self.to_array(show_order=show_order), get_symbols_lut())
+        return chars.ravel()[:-1].tobytes().decode('utf-32-le')
 
     @staticmethod
     def from_string(s: str):
@@ -477,24 +925,27 @@ class RectTextViewer:
         >>> vr = RectTextViewer([(1, 1, 2, 3), (3, 4, 7, 8), (4, 1, 6, 2)])
         >>> st = vr.to_string(show_order=True)
         >>> assert vr == RectTextViewer.from_string(st)
+        >>> assert vr == RectTextViewer.from_string('\\n'.join(line.rstrip() for line in st.splitlines()))
+
+        >>> RectTextViewer.from_string(st.replace('2', 'ж'))
+        Traceback (most recent call last):
+        ...
+        ValueError: next symbols are not allowed in the map: {'ж'}
+
+        >>> Config.BOUND_FILLER_STR = '·'
+        >>> assert vr == RectTextViewer.from_string(vr.to_string(show_order=True))
+        >>> Config.BOUND_FILLER_STR = '#'
         """
-        return RectTextViewer.from_array(
-            np.array(
-                [
-                    [
-                        (
-                            _EMPTY_FILLER_INT if v == Config.EMPTY_FILLER_STR else (
-                                _BOUND_FILLER_INT if v == Config.BOUND_FILLER_STR else (
-                                    int(v)
-                                )
-                            )
-                        )
-                        for v in line
-                    ]
-                    for line in s.strip('\n').splitlines()
-                ]
-            )
-        )
+        text = '\n'.join(s.strip('\n').splitlines())
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        """code points of the map lines, the lines are padded cuz trailing spaces may be lost while editing"""
+
+        arr, has_unknown = _from_codes_kernel(codes, *get_fillers_codes())
+        if has_unknown:
+            symbols = set(text) - set('0123456789\n') - {Config.EMPTY_FILLER_STR, Config.BOUND_FILLER_STR}
+            raise ValueError(f"next symbols are not allowed in the map: {symbols}")
+
+        return RectTextViewer.from_array(arr)
 
     def show(self, show_order: bool = True):
         print(self.to_string(show_order=show_order))
@@ -795,12 +1246,15 @@ class OrderedRectangles:
         mn = self.rects[:, :2].min()
         mx = self.rects[:, 2:].max()
 
-        arr = (self.rects - mn) * ((units - 1) / (mx - mn))
-        arr[:, :2] = np.floor(arr[:, :2])
-        arr[:, 2:] = np.ceil(arr[:, 2:])
-        return (
-            np.minimum(units, arr.astype(int) + 1)
-        )  # minimum is necessary due to precision errors sometimes
+        # all operations are inplace to not allocate temporary arrays
+        arr = np.subtract(self.rects, mn, dtype=float)
+        arr *= (units - 1) / (mx - mn)
+        np.floor(arr[:, :2], out=arr[:, :2])
+        np.ceil(arr[:, 2:], out=arr[:, 2:])
+
+        result = arr.astype(int)
+        result += 1
+        return np.minimum(result, units, out=result)  # minimum is necessary due to precision errors sometimes
 
     def get_order_map(self, units: int = 0, show_order: bool = True):
         arr = self.get_discretized_array(units=units)